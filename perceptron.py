@@ -5,6 +5,8 @@ from matplotlib.widgets import Slider, Button
 import matplotlib.animation as animation
 import time
 import csv
+import os
+from multiprocessing import Pool, shared_memory
 
 class DataPointAgent:
     """
@@ -44,11 +46,12 @@ class PerceptronAgent:
     - Regla de actualización: w_new = w_old + α·error·x
     """
     
-    def __init__(self, learning_rate=0.1):
+    def __init__(self, learning_rate=0.1, rng=random):
         # Inicializar pesos y bias aleatoriamente
-        self.w1 = random.uniform(-1, 1)
-        self.w2 = random.uniform(-1, 1)
-        self.bias = random.uniform(-1, 1)
+        self.rng = rng
+        self.w1 = self.rng.uniform(-1, 1)
+        self.w2 = self.rng.uniform(-1, 1)
+        self.bias = self.rng.uniform(-1, 1)
         self.learning_rate = learning_rate
         self.training_complete = False
         self.iteration = 0
@@ -58,18 +61,42 @@ class PerceptronAgent:
         activation = self.w1 * x + self.w2 * y + self.bias
         return 1 if activation >= 0 else -1
     
+    def _actualizar(self, x, y, label):
+        """Aplica la regla de actualización a un punto; devuelve True si hubo error"""
+        prediction = self.predict(x, y)
+        error = label - prediction
+        
+        if error != 0:  # Solo actualizar si hay error
+            self.w1 += self.learning_rate * error * x
+            self.w2 += self.learning_rate * error * y
+            self.bias += self.learning_rate * error
+            return True
+        return False
+    
     def train_step(self, data_points):
         """Entrena el perceptrón con todos los puntos de datos en una iteración"""
         updated = False
         
         for point in data_points:
-            prediction = self.predict(point.x, point.y)
-            error = point.label - prediction
-            
-            if error != 0:  # Solo actualizar si hay error
-                self.w1 += self.learning_rate * error * point.x
-                self.w2 += self.learning_rate * error * point.y
-                self.bias += self.learning_rate * error
+            if self._actualizar(point.x, point.y, point.label):
+                updated = True
+        
+        self.iteration += 1
+        return updated
+    
+    def train_step_arreglo(self, data, indices=None):
+        """Entrena una iteración sobre un buffer plano de floats [x0, y0, etiqueta0, x1, ...]"""
+        updated = False
+        
+        if indices is None:
+            # Recorrer el buffer de tres en tres evita calcular cada índice
+            valores = iter(data)
+            filas = zip(valores, valores, valores)
+        else:
+            filas = ((data[3 * i], data[3 * i + 1], data[3 * i + 2]) for i in indices)
+        
+        for x, y, label in filas:
+            if self._actualizar(x, y, label):
                 updated = True
         
         self.iteration += 1
@@ -89,9 +116,9 @@ class PerceptronAgent:
     
     def reset(self, learning_rate):
         """Reinicia el perceptrón"""
-        self.w1 = random.uniform(-1, 1)
-        self.w2 = random.uniform(-1, 1)
-        self.bias = random.uniform(-1, 1)
+        self.w1 = self.rng.uniform(-1, 1)
+        self.w2 = self.rng.uniform(-1, 1)
+        self.bias = self.rng.uniform(-1, 1)
         self.learning_rate = learning_rate
         self.training_complete = False
         self.iteration = 0
@@ -174,6 +201,134 @@ class PerceptronModel:
         
         return (correct / total) * 100 if total > 0 else 0
 
+# Vista del dataset compartido dentro de cada proceso trabajador
+_datos_compartidos = None
+_memoria_compartida = None
+
+def _iniciarTrabajador(nombre, num_valores):
+    """Conecta el proceso trabajador al bloque de memoria compartida (sin copiar datos)"""
+    global _datos_compartidos, _memoria_compartida
+    _memoria_compartida = shared_memory.SharedMemory(name=nombre)
+    # Indexar un memoryview 'd' devuelve floats de Python directamente del buffer
+    _datos_compartidos = _memoria_compartida.buf.cast('d')[:num_valores]
+
+def _entrenarPerceptron(args):
+    """Entrena un PerceptronAgent independiente sobre el dataset compartido"""
+    seed, indices, learning_rate, max_iterations = args
+    # Generador propio por tarea: la semilla no afecta al estado global del proceso
+    perceptron = PerceptronAgent(learning_rate, rng=random.Random(seed))
+
+    while perceptron.iteration < max_iterations:
+        if not perceptron.train_step_arreglo(_datos_compartidos, indices):
+            break
+
+    return perceptron.w1, perceptron.w2, perceptron.bias, perceptron.iteration
+
+class PerceptronEnsemble:
+    """
+    Conjunto de perceptrones independientes entrenados en paralelo.
+
+    El dataset se coloca una sola vez en memoria compartida y cada
+    proceso trabajador entrena sus PerceptronAgent leyendo directamente
+    de ella. La predicción se hace por votación mayoritaria.
+    """
+
+    def __init__(self, data_points, num_models=8, learning_rate=0.1, max_iterations=100,
+                 seeds=None, subsets=None, num_workers=None):
+        self.data_points = data_points
+        self.num_models = num_models
+        self.learning_rate = learning_rate
+        self.max_iterations = max_iterations
+        self.seeds = list(seeds) if seeds is not None else list(range(num_models))
+        # Cada subconjunto es una lista de índices de data_points (None = todos)
+        self.subsets = list(subsets) if subsets is not None else [None] * num_models
+        self.num_workers = num_workers if num_workers is not None else min(num_models, os.cpu_count() or 1)
+
+        if num_models < 1:
+            raise ValueError("num_models debe ser al menos 1")
+        if self.num_workers < 1:
+            raise ValueError("num_workers debe ser al menos 1")
+        if len(self.seeds) != num_models or len(self.subsets) != num_models:
+            raise ValueError("seeds y subsets deben tener num_models elementos")
+
+        total = len(data_points)
+        for subset in self.subsets:
+            if subset is not None and any(not 0 <= i < total for i in subset):
+                raise ValueError(f"subsets contiene índices fuera de rango [0, {total})")
+
+        self.weights = np.zeros((num_models, 3))  # filas [w1, w2, bias]
+        self.iterations = [0] * num_models
+        self.training_complete = False
+
+    def entrenar(self):
+        """Entrena todos los perceptrones y devuelve sus pesos (num_models, 3)"""
+        forma = (len(self.data_points), 3)
+        num_bytes = forma[0] * forma[1] * np.dtype(np.float64).itemsize
+
+        # El dataset se escribe directamente en memoria compartida, sin arreglo intermedio
+        memoria = shared_memory.SharedMemory(create=True, size=max(num_bytes, 8))
+        try:
+            compartido = np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+            for i, point in enumerate(self.data_points):
+                compartido[i] = (point.x, point.y, point.label)
+
+            tareas = [(seed, subset, self.learning_rate, self.max_iterations)
+                      for seed, subset in zip(self.seeds, self.subsets)]
+
+            with Pool(self.num_workers, initializer=_iniciarTrabajador,
+                      initargs=(memoria.name, compartido.size)) as pool:
+                resultados = pool.map(_entrenarPerceptron, tareas)
+
+            del compartido
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+        for i, (w1, w2, bias, iteration) in enumerate(resultados):
+            self.weights[i] = (w1, w2, bias)
+            self.iterations[i] = iteration
+        self.training_complete = True
+
+        return self.weights
+
+    def predict(self, x, y):
+        """
+        Predicción por votación mayoritaria para uno o varios puntos (x, y).
+
+        x e y se combinan con broadcasting de NumPy; si ambos son escalares
+        se devuelve un int, si no un arreglo con la forma combinada.
+        En caso de empate (votos == 0) se predice +1, igual que predict().
+        """
+        if not self.training_complete:
+            raise RuntimeError("El ensamble no está entrenado; llama a entrenar() primero")
+
+        xs, ys = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        forma = xs.shape
+
+        # Activaciones de todos los modelos en una sola pasada: (num_puntos, num_models)
+        activations = (np.outer(xs.ravel(), self.weights[:, 0])
+                       + np.outer(ys.ravel(), self.weights[:, 1]) + self.weights[:, 2])
+        votes = np.where(activations >= 0, 1, -1).sum(axis=1)
+        predictions = np.where(votes >= 0, 1, -1).reshape(forma)
+
+        return int(predictions) if forma == () else predictions
+
+    def evaluarRendimiento(self):
+        """Evalúa el rendimiento del ensamble sobre sus puntos de datos"""
+        if not self.training_complete:
+            raise RuntimeError("El ensamble no está entrenado; llama a entrenar() primero")
+
+        total = len(self.data_points)
+        if total == 0:
+            return 0
+
+        xs = np.array([p.x for p in self.data_points])
+        ys = np.array([p.y for p in self.data_points])
+        labels = np.array([p.label for p in self.data_points])
+        correct = np.sum(self.predict(xs, ys) == labels)
+
+        return (correct / total) * 100
+
 class PerceptronVisualization:
     """
     Clase para manejar la visualización interactiva del perceptrón.
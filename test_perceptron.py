@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+import pytest
+
+from perceptron import DataPointAgent, PerceptronAgent, PerceptronEnsemble
+
+
+def generarDatos(num_points=60, seed=1):
+    """Puntos linealmente separables (y = 0.5*x + 1), reproducibles"""
+    rng = random.Random(seed)
+    points = []
+    for i in range(num_points):
+        x = rng.uniform(-8, 8)
+        y = rng.uniform(-8, 8)
+        label = 1 if 0.5 * x - y + 1 >= 0 else -1
+        points.append(DataPointAgent(i, x, y, label))
+    return points
+
+
+def entrenarSerial(points, seed, max_iterations=100):
+    perceptron = PerceptronAgent(0.1, rng=random.Random(seed))
+    while perceptron.iteration < max_iterations and perceptron.train_step(points):
+        pass
+    return perceptron
+
+
+def test_ensamble_coincide_con_entrenamiento_serial():
+    points = generarDatos()
+    ensemble = PerceptronEnsemble(points, num_models=3, seeds=[0, 5, 9], num_workers=2)
+    weights = ensemble.entrenar()
+
+    for i, seed in enumerate([0, 5, 9]):
+        perceptron = entrenarSerial(points, seed)
+        assert tuple(weights[i]) == (perceptron.w1, perceptron.w2, perceptron.bias)
+        assert ensemble.iterations[i] == perceptron.iteration
+
+
+def test_subconjuntos():
+    points = generarDatos()
+    subset = list(range(0, 60, 2))
+    ensemble = PerceptronEnsemble(points, num_models=2, seeds=[3, 3], subsets=[subset, []])
+    weights = ensemble.entrenar()
+
+    perceptron = entrenarSerial([points[i] for i in subset], seed=3)
+    assert tuple(weights[0]) == (perceptron.w1, perceptron.w2, perceptron.bias)
+
+    # Un subconjunto vacío deja los pesos iniciales tras una sola iteración
+    inicial = PerceptronAgent(0.1, rng=random.Random(3))
+    assert tuple(weights[1]) == (inicial.w1, inicial.w2, inicial.bias)
+    assert ensemble.iterations[1] == 1
+
+
+def test_formas_de_predict():
+    ensemble = PerceptronEnsemble(generarDatos(), num_models=2)
+    ensemble.entrenar()
+
+    assert isinstance(ensemble.predict(1.0, 2.0), int)
+    assert ensemble.predict(np.zeros(5), np.zeros(5)).shape == (5,)
+    assert ensemble.predict(1.0, [1.0, 2.0]).shape == (2,)
+    with pytest.raises(ValueError):
+        ensemble.predict([1.0, 2.0], [1.0, 2.0, 3.0])
+
+
+def test_errores():
+    points = generarDatos(5)
+    ensemble = PerceptronEnsemble(points, num_models=2)
+    with pytest.raises(RuntimeError):
+        ensemble.predict(0.0, 0.0)
+    with pytest.raises(RuntimeError):
+        ensemble.evaluarRendimiento()
+
+    with pytest.raises(ValueError):
+        PerceptronEnsemble(points, num_models=0)
+    with pytest.raises(ValueError):
+        PerceptronEnsemble(points, num_models=2, num_workers=0)
+    with pytest.raises(ValueError):
+        PerceptronEnsemble(points, num_models=1, subsets=[[5]])